@@ -2,9 +2,11 @@
 Game Engine Module - Handles game physics, collisions, and main game logic
 """
 import pygame
+import math
 import numpy as np
 from car import Car
 from track import Track
+from drawing import blit_all
 
 class GameEngine:
     """
@@ -33,9 +35,34 @@ class GameEngine:
         self.difficulty_level = 0.5  # 0.0 to 1.0, starts at medium
         self.performance_history = []
         
-        # Create obstacles and power-ups
-        self.obstacles = []
-        self.power_ups = []
+        # Obstacles and power-ups stored as parallel arrays (structure of arrays)
+        self.obs_x = np.empty(0, dtype=np.float32)
+        self.obs_y = np.empty(0, dtype=np.float32)
+        self.obs_r = np.empty(0, dtype=np.float32)
+        self.obs_active = np.empty(0, dtype=bool)
+        
+        self.pu_x = np.empty(0, dtype=np.float32)
+        self.pu_y = np.empty(0, dtype=np.float32)
+        self.pu_r = np.empty(0, dtype=np.float32)
+        self.pu_consumed = np.empty(0, dtype=bool)
+        
+        # Combined entity arrays (obstacles, then power-ups, then checkpoints) so a
+        # single squared-distance pass feeds every proximity check; rebuilt lazily
+        self.ent_x = np.empty(0, dtype=np.float32)
+        self.ent_y = np.empty(0, dtype=np.float32)
+        self.ent_r2 = np.empty(0, dtype=np.float32)
+        self._entities_dirty = True
+        
+        # Rendering colors
+        self.obstacle_color = (200, 100, 0)  # Orange obstacles
+        self.power_up_color = (0, 255, 0)  # Green power-ups
+        
+        # Pre-drawn entity sprites keyed by (radius, color)
+        self._sprite_cache = {}
+        
+        # Screen regions drawn last frame, used for dirty-rect display updates
+        self._last_car_rect = None
+        self._last_entity_rects = set()
         
         # Initialize the track with obstacles and power-ups
         self._initialize_track()
@@ -45,28 +72,108 @@ class GameEngine:
         # This will be implemented when the track generation system is created
         pass
     
-    def update(self, keys, elapsed_time):
+    def add_obstacle(self, x, y, radius):
+        """
+        Add a circular obstacle to the track.
+        
+        Args:
+            x (float): Obstacle center x position
+            y (float): Obstacle center y position
+            radius (float): Obstacle radius
+        """
+        self.obs_x = np.append(self.obs_x, np.float32(x))
+        self.obs_y = np.append(self.obs_y, np.float32(y))
+        self.obs_r = np.append(self.obs_r, np.float32(radius))
+        self.obs_active = np.append(self.obs_active, True)
+        self._entities_dirty = True
+    
+    def add_power_up(self, x, y, radius):
+        """
+        Add a circular power-up to the track.
+        
+        Args:
+            x (float): Power-up center x position
+            y (float): Power-up center y position
+            radius (float): Power-up radius
+        """
+        self.pu_x = np.append(self.pu_x, np.float32(x))
+        self.pu_y = np.append(self.pu_y, np.float32(y))
+        self.pu_r = np.append(self.pu_r, np.float32(radius))
+        self.pu_consumed = np.append(self.pu_consumed, False)
+        self._entities_dirty = True
+    
+    def _rebuild_entities(self):
+        """Rebuild the combined entity arrays used by the fused proximity pass."""
+        checkpoints = self.track.checkpoints_np
+        car_radius = self._get_car_radius()
+        checkpoint_radius = self.track.track_width / 2
+        
+        self.ent_x = np.concatenate([self.obs_x, self.pu_x, checkpoints[:, 0]])
+        self.ent_y = np.concatenate([self.obs_y, self.pu_y, checkpoints[:, 1]])
+        self.ent_r2 = np.concatenate([
+            (self.obs_r + car_radius)**2,
+            (self.pu_r + car_radius)**2,
+            np.full(len(checkpoints), checkpoint_radius * checkpoint_radius, dtype=np.float32),
+        ]).astype(np.float32)
+        self._entities_dirty = False
+    
+    def _get_circle_sprite(self, radius, color):
+        """
+        Get a cached circle sprite for an obstacle or power-up.
+        
+        Args:
+            radius (int): Circle radius
+            color: Circle color
+            
+        Returns:
+            pygame.Surface: Sprite with the circle drawn on it
+        """
+        key = (radius, color)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            sprite = sprite.convert_alpha()
+            self._sprite_cache[key] = sprite
+        return sprite
+    
+    def _get_car_radius(self):
+        """Get the radius of the circle used for car collision checks."""
+        return max(self.player_car.width, self.player_car.height) / 2
+    
+    def update(self, input_mask, elapsed_time):
         """
         Update game state based on input and elapsed time.
         
         Args:
-            keys: Pressed keys for player input
+            input_mask: Bitmask of pressed player controls (car.INPUT_* flags)
             elapsed_time: Time elapsed since game start
         """
         # Update player car
-        self.player_car.update(keys, self.track, elapsed_time)
+        self.player_car.update(input_mask, self.track, elapsed_time)
         
         # Check for collisions with track boundaries
         self._check_track_collisions()
         
+        # Compute car-to-entity squared distances once for all proximity checks
+        if self._entities_dirty:
+            self._rebuild_entities()
+        dx = self.ent_x - self.player_car.x
+        dy = self.ent_y - self.player_car.y
+        d2 = dx * dx + dy * dy
+        in_reach = d2 < self.ent_r2
+        
+        n_obs = len(self.obs_x)
+        n_pu = len(self.pu_x)
+        
         # Check for collisions with obstacles
-        self._check_obstacle_collisions()
+        self._check_obstacle_collisions(in_reach[:n_obs])
         
         # Check for power-up collection
-        self._check_power_up_collection()
+        self._check_power_up_collection(in_reach[n_obs:n_obs + n_pu])
         
         # Check for lap completion
-        self._check_lap_completion(elapsed_time)
+        self._check_lap_completion(elapsed_time, in_reach[n_obs + n_pu:], d2[n_obs + n_pu:])
         
         # Update dynamic difficulty
         self._update_difficulty()
@@ -76,25 +183,80 @@ class GameEngine:
         # Will be implemented with track collision detection
         pass
     
-    def _check_obstacle_collisions(self):
-        """Check and handle collisions with obstacles."""
-        # Will be implemented with obstacle collision detection
-        pass
+    def _check_obstacle_collisions(self, in_reach):
+        """
+        Check and handle collisions with obstacles.
+        
+        Args:
+            in_reach: Boolean mask of obstacles overlapping the car
+        """
+        hits = in_reach & self.obs_active
+        if not hits.any():
+            return
+        
+        car = self.player_car
+        car_radius = self._get_car_radius()
+        heading_x, heading_y = car.get_heading()
+        vx = heading_x * car.speed
+        vy = heading_y * car.speed
+        x, y = car.get_position()
+        closing = False
+        
+        for i in np.flatnonzero(hits):
+            ox = float(self.obs_x[i])
+            oy = float(self.obs_y[i])
+            
+            # Normal from the obstacle center to the car
+            nx = x - ox
+            ny = y - oy
+            dist = math.hypot(nx, ny)
+            if dist == 0:
+                nx, ny, dist = -heading_x, -heading_y, 1.0
+            
+            # Moving toward the obstacle if velocity points against the normal
+            if vx * nx + vy * ny < 0:
+                closing = True
+            
+            # Push the car back out to the contact distance
+            contact = float(self.obs_r[i]) + car_radius
+            if dist < contact:
+                x = ox + nx / dist * contact
+                y = oy + ny / dist * contact
+        
+        car.set_position(x, y)
+        
+        # Bounce the car back off the obstacle
+        if closing:
+            car.speed = -car.speed * 0.5
     
-    def _check_power_up_collection(self):
-        """Check and handle power-up collection."""
-        # Will be implemented with power-up collection logic
-        pass
+    def _check_power_up_collection(self, in_reach):
+        """
+        Check and handle power-up collection.
+        
+        Args:
+            in_reach: Boolean mask of power-ups overlapping the car
+        """
+        hits = in_reach & ~self.pu_consumed
+        
+        # Consume collected power-ups in place and boost the car
+        if hits.any():
+            self.pu_consumed |= hits
+            self.player_car.apply_boost()
     
-    def _check_lap_completion(self, elapsed_time):
+    def _check_lap_completion(self, elapsed_time, near_checkpoint, checkpoint_d2):
         """
         Check if player has completed a lap and update lap statistics.
         
         Args:
             elapsed_time: Time elapsed since game start
+            near_checkpoint: Boolean mask of checkpoints within reach of the car
+            checkpoint_d2: Squared distances from the car to each checkpoint
         """
-        # Will be implemented with lap tracking logic
-        pass
+        # Track the nearest checkpoint the car has reached
+        if near_checkpoint.any():
+            self.last_checkpoint = int(np.argmin(checkpoint_d2))
+        
+        # Lap counting will be implemented with lap tracking logic
     
     def _update_difficulty(self):
         """Update the dynamic difficulty based on player performance."""
@@ -109,17 +271,41 @@ class GameEngine:
         
         Args:
             screen: Pygame screen surface to render on
+            
+        Returns:
+            list: Rects of screen regions that changed since the last frame
         """
         # Render track
         self.track.render(screen)
         
-        # Render obstacles
-        for obstacle in self.obstacles:
-            obstacle.render(screen)
-        
-        # Render power-ups
-        for power_up in self.power_ups:
-            power_up.render(screen)
+        # Render obstacles and power-ups in a single batch
+        blit_list = []
+        for i in np.flatnonzero(self.obs_active):
+            r = int(self.obs_r[i])
+            blit_list.append((self._get_circle_sprite(r, self.obstacle_color),
+                              (int(self.obs_x[i]) - r, int(self.obs_y[i]) - r)))
+        for i in np.flatnonzero(~self.pu_consumed):
+            r = int(self.pu_r[i])
+            blit_list.append((self._get_circle_sprite(r, self.power_up_color),
+                              (int(self.pu_x[i]) - r, int(self.pu_y[i]) - r)))
+        if blit_list:
+            blit_all(screen, blit_list)
         
         # Render player car
         self.player_car.render(screen)
+        
+        # Entities that appeared, moved or disappeared since the last frame need their area redrawn
+        entity_rects = {(pos[0], pos[1], sprite.get_width(), sprite.get_height())
+                        for sprite, pos in blit_list}
+        dirty = [pygame.Rect(rect) for rect in self._last_entity_rects ^ entity_rects]
+        self._last_entity_rects = entity_rects
+        
+        # Cover both the old and new car positions
+        car_rect = self.player_car.rect
+        if self._last_car_rect is None:
+            dirty.append(car_rect.copy())
+        else:
+            dirty.append(car_rect.union(self._last_car_rect))
+        self._last_car_rect = car_rect.copy()
+        
+        return dirty
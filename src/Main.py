@@ -4,9 +4,8 @@ A simple 1-player 2D retro racing game with an AI-driven car on a looping track.
 """
 import pygame
 import sys
-import time
 from game_engine import GameEngine
-from car import Car
+from car import Car, INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT
 from track import Track
 from ui import UI
 
@@ -20,6 +19,12 @@ GAME_TITLE = "Retro Racing Game"
 FPS = 60
 TIME_LIMIT = 120  # seconds
 
+# Key bindings bound once to avoid attribute lookups on every frame
+_K_UP = pygame.K_UP
+_K_DOWN = pygame.K_DOWN
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+
 def main():
     """Main game function that initializes and runs the game loop."""
     # Set up the display
@@ -35,14 +40,14 @@ def main():
     
     # Game state variables
     running = True
+    full_update = True  # Present the whole screen on the next frame
     game_time = 0
-    start_time = time.time()
+    start_time = pygame.time.get_ticks()
     
     # Main game loop
     while running:
         # Calculate elapsed time
-        current_time = time.time()
-        elapsed_time = current_time - start_time
+        elapsed_time = (pygame.time.get_ticks() - start_time) / 1000.0
         remaining_time = max(0, TIME_LIMIT - elapsed_time)
         
         # Process events
@@ -52,22 +57,32 @@ def main():
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window was uncovered, so its contents may be stale
+                full_update = True
         
         # Update game state
         keys = pygame.key.get_pressed()
-        game_engine.update(keys, elapsed_time)
+        input_mask = ((INPUT_UP if keys[_K_UP] else 0)
+                      | (INPUT_DOWN if keys[_K_DOWN] else 0)
+                      | (INPUT_LEFT if keys[_K_LEFT] else 0)
+                      | (INPUT_RIGHT if keys[_K_RIGHT] else 0))
+        game_engine.update(input_mask, elapsed_time)
         
         # Check if time limit reached
         if remaining_time <= 0:
             running = False
         
-        # Render the game
-        screen.fill((0, 0, 0))  # Clear screen with black
-        game_engine.render(screen)
-        ui.render(screen, game_engine.lap_count, remaining_time, game_engine.best_lap_time)
+        # Render the game (the opaque track surface clears the screen)
+        dirty_rects = game_engine.render(screen)
+        dirty_rects += ui.render(screen, game_engine.lap_count, remaining_time, game_engine.best_lap_time)
         
-        # Update the display
-        pygame.display.flip()
+        # Update the display (whole screen on the first or exposed frame, changed regions otherwise)
+        if full_update:
+            pygame.display.flip()
+            full_update = False
+        else:
+            pygame.display.update(dirty_rects)
         
         # Cap the frame rate
         clock.tick(FPS)
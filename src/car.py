@@ -5,12 +5,103 @@ import pygame
 import math
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Bits of the player input mask
+INPUT_UP = 1 << 0
+INPUT_DOWN = 1 << 1
+INPUT_LEFT = 1 << 2
+INPUT_RIGHT = 1 << 3
+
+# Angle step (in degrees) between cached rotated car sprites
+ROTATION_STEP = 5
+ROTATION_BUCKETS = 360 // ROTATION_STEP
+
+# Direction lookup tables matching the rotation buckets. Tuples of Python floats
+# keep the plain-Python fallback free of NumPy scalars and are constants to Numba.
+_COS = tuple(np.cos(np.deg2rad(np.arange(0, 360, ROTATION_STEP))).tolist())
+_SIN = tuple(np.sin(np.deg2rad(np.arange(0, 360, ROTATION_STEP))).tolist())
+
+
+@njit(cache=True)
+def _step(speed, angle, accel_flag, brake_flag, left_flag, right_flag,
+          max_s, min_s, a_rate, d_rate, steer_rate, friction, x, y):
+    """
+    Advance car physics and position by one frame.
+    
+    Returns:
+        tuple: (speed, angle, x, y, angle_idx) after the step
+    """
+    # Handle acceleration and braking
+    if accel_flag:
+        speed += a_rate
+    elif brake_flag:
+        speed -= d_rate
+    
+    # Apply friction
+    if speed > 0:
+        speed -= friction
+        if speed < 0:
+            speed = 0.0
+    elif speed < 0:
+        speed += friction
+        if speed > 0:
+            speed = 0.0
+    
+    # Clamp speed to limits
+    speed = max(min_s, min(max_s, speed))
+    
+    # Handle steering (only when moving)
+    if abs(speed) > 0.1:
+        steering_factor = steer_rate * (speed / max_s)
+        if left_flag:
+            angle -= steering_factor
+        if right_flag:
+            angle += steering_factor
+    
+    # Quantize the angle so movement matches the rendered sprite
+    idx = int((math.degrees(angle) % 360) / ROTATION_STEP) % ROTATION_BUCKETS
+    
+    # Update position
+    x += _COS[idx] * speed
+    y += _SIN[idx] * speed
+    
+    return speed, angle, x, y, idx
+
+
+# Prefer the compiled Cython step (car_fast.pyx) when it has been built with
+# the same rotation buckets, so its angle index matches the sprite cache
+try:
+    import car_fast
+except ImportError:
+    car_fast = None
+if (car_fast is not None
+        and getattr(car_fast, 'ROTATION_STEP', None) == ROTATION_STEP
+        and getattr(car_fast, 'ROTATION_BUCKETS', None) == ROTATION_BUCKETS):
+    _step = car_fast.step
+
+
 class Car:
     """
     Car class that handles car physics, controls, and rendering.
     Implements simple physics for acceleration, deceleration, and steering.
     """
     
+    __slots__ = (
+        'is_player', '_fx', '_fy', 'x', 'y', 'angle', '_angle_idx', 'speed',
+        'max_speed', 'max_reverse_speed', 'acceleration_rate', 'deceleration_rate',
+        'steering_rate', 'friction', 'width', 'height',
+        'is_accelerating', 'is_braking', 'is_turning_left', 'is_turning_right',
+        'ai_reaction_time', 'ai_accuracy', 'ai_last_decision_time',
+        'image', 'rect', '_rot_cache', 'rotated_image',
+    )
+    
     def __init__(self, is_player=True, x=400, y=300):
         """
         Initialize the car with position and properties.
@@ -21,15 +112,17 @@ class Car:
             y (int): Initial y position
         """
         self.is_player = is_player
-        self.x = x
-        self.y = y
-        self.angle = 0  # Angle in radians
-        self.speed = 0
-        self.acceleration = 0
+        self._fx = float(x)  # Sub-pixel position accumulators
+        self._fy = float(y)
+        self.x = int(x)  # Integer pixel position
+        self.y = int(y)
+        self.angle = 0.0  # Angle in radians
+        self._angle_idx = 0  # Rotation bucket for the current angle
+        self.speed = 0.0
         
         # Car properties
-        self.max_speed = 10
-        self.max_reverse_speed = -5
+        self.max_speed = 10.0
+        self.max_reverse_speed = -5.0
         self.acceleration_rate = 0.1
         self.deceleration_rate = 0.05
         self.steering_rate = 0.1
@@ -54,6 +147,11 @@ class Car:
         # Temporary car image (will be replaced with pixel art)
         self.image = self._create_temp_car_image()
         self.rect = self.image.get_rect(center=(self.x, self.y))
+        
+        # Pre-rotated car images, one per angle bucket
+        self._rot_cache = [pygame.transform.rotate(self.image, -a).convert_alpha()
+                           for a in range(0, 360, ROTATION_STEP)]
+        self.rotated_image = self._rot_cache[0]
     
     def _create_temp_car_image(self):
         """Create a temporary car image for development."""
@@ -69,53 +167,50 @@ class Car:
         pygame.draw.rect(car_image, (0, 0, 0), (self.width-10, 5, 5, 5))
         pygame.draw.rect(car_image, (0, 0, 0), (self.width-10, self.height-10, 5, 5))
         
-        return car_image
+        # Match the display pixel format for fast blitting
+        return car_image.convert_alpha()
     
-    def update(self, keys, track, elapsed_time):
+    def update(self, input_mask, track, elapsed_time):
         """
         Update car state based on input, track, and elapsed time.
         
         Args:
-            keys: Pressed keys for player input
+            input_mask: Bitmask of pressed player controls (INPUT_* flags)
             track: Track object for collision detection
             elapsed_time: Time elapsed since game start
         """
         if self.is_player:
-            self._handle_player_input(keys)
+            self._handle_player_input(input_mask)
         else:
             self._handle_ai_behavior(track, elapsed_time)
         
-        # Apply physics
-        self._apply_physics()
-        
-        # Update position
-        self._update_position()
+        # Apply physics and update position
+        self.speed, self.angle, self._fx, self._fy, self._angle_idx = _step(
+            self.speed, self.angle,
+            self.is_accelerating, self.is_braking,
+            self.is_turning_left, self.is_turning_right,
+            self.max_speed, self.max_reverse_speed,
+            self.acceleration_rate, self.deceleration_rate,
+            self.steering_rate, self.friction,
+            self._fx, self._fy)
+        self.x = int(self._fx)
+        self.y = int(self._fy)
         
         # Update car image and rect
         self._update_image()
     
-    def _handle_player_input(self, keys):
+    def _handle_player_input(self, input_mask):
         """
         Handle player input from keyboard.
         
         Args:
-            keys: Pressed keys
+            input_mask: Bitmask of pressed player controls (INPUT_* flags)
         """
-        # Reset state
-        self.is_accelerating = False
-        self.is_braking = False
-        self.is_turning_left = False
-        self.is_turning_right = False
-        
-        # Check keys
-        if keys[pygame.K_UP]:
-            self.is_accelerating = True
-        if keys[pygame.K_DOWN]:
-            self.is_braking = True
-        if keys[pygame.K_LEFT]:
-            self.is_turning_left = True
-        if keys[pygame.K_RIGHT]:
-            self.is_turning_right = True
+        # Check control bits
+        self.is_accelerating = bool(input_mask & INPUT_UP)
+        self.is_braking = bool(input_mask & INPUT_DOWN)
+        self.is_turning_left = bool(input_mask & INPUT_LEFT)
+        self.is_turning_right = bool(input_mask & INPUT_RIGHT)
     
     def _handle_ai_behavior(self, track, elapsed_time):
         """
@@ -129,60 +224,13 @@ class Car:
         # For now, just make the AI car move forward
         self.is_accelerating = True
     
-    def _apply_physics(self):
-        """Apply physics to car movement including acceleration, friction, and steering."""
-        # Handle acceleration and braking
-        if self.is_accelerating:
-            self.acceleration = self.acceleration_rate
-        elif self.is_braking:
-            self.acceleration = -self.deceleration_rate
-        else:
-            self.acceleration = 0
-        
-        # Apply acceleration to speed
-        self.speed += self.acceleration
-        
-        # Apply friction
-        if self.speed > 0:
-            self.speed -= self.friction
-            if self.speed < 0:
-                self.speed = 0
-        elif self.speed < 0:
-            self.speed += self.friction
-            if self.speed > 0:
-                self.speed = 0
-        
-        # Clamp speed to limits
-        self.speed = max(self.max_reverse_speed, min(self.max_speed, self.speed))
-        
-        # Handle steering (only when moving)
-        if abs(self.speed) > 0.1:
-            steering_factor = self.steering_rate * (self.speed / self.max_speed)
-            if self.is_turning_left:
-                self.angle -= steering_factor
-            if self.is_turning_right:
-                self.angle += steering_factor
-    
-    def _update_position(self):
-        """Update car position based on speed and angle."""
-        # Calculate movement vector
-        dx = math.cos(self.angle) * self.speed
-        dy = math.sin(self.angle) * self.speed
-        
-        # Update position
-        self.x += dx
-        self.y += dy
-    
     def _update_image(self):
         """Update car image and rect based on current state."""
-        # Rotate the original image
-        rotated_image = pygame.transform.rotate(self.image, -math.degrees(self.angle))
+        # Look up the pre-rotated image for the current angle bucket
+        self.rotated_image = self._rot_cache[self._angle_idx]
         
         # Update the rect
-        self.rect = rotated_image.get_rect(center=(self.x, self.y))
-        
-        # Store the rotated image for rendering
-        self.rotated_image = rotated_image
+        self.rect = self.rotated_image.get_rect(center=(self.x, self.y))
     
     def render(self, screen):
         """
@@ -201,6 +249,24 @@ class Car:
         """Get the current position of the car."""
         return (self.x, self.y)
     
+    def set_position(self, x, y):
+        """
+        Move the car to a new position, e.g. when resolving a collision.
+        
+        Args:
+            x (float): New x position
+            y (float): New y position
+        """
+        self._fx = float(x)
+        self._fy = float(y)
+        self.x = int(self._fx)
+        self.y = int(self._fy)
+        self.rect.center = (self.x, self.y)
+    
+    def get_heading(self):
+        """Get the unit direction the car moves along (its quantized angle)."""
+        return (_COS[self._angle_idx], _SIN[self._angle_idx])
+    
     def get_speed(self):
         """Get the current speed of the car."""
         return self.speed
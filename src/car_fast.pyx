@@ -0,0 +1,90 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Car Fast Module - Compiled car physics step
+
+Optional Cython version of car._step. Build it in place with:
+
+    cythonize -i car_fast.pyx
+
+When the compiled module is available, car.py uses it instead of the
+Numba/Python implementation.
+"""
+cimport cython
+from libc.math cimport cos, sin, fmod, fabs, M_PI
+from libc.stdlib cimport malloc
+
+# Angle step (in degrees) between rotation buckets; car.py only uses this
+# module when ROTATION_STEP and ROTATION_BUCKETS match its own values
+ROTATION_STEP = 5
+ROTATION_BUCKETS = 360 // ROTATION_STEP
+
+cdef int _rotation_step = ROTATION_STEP
+cdef int _rotation_buckets = ROTATION_BUCKETS
+
+# Direction lookup tables matching the rotation buckets
+cdef double *_COS = <double *> malloc(_rotation_buckets * sizeof(double))
+cdef double *_SIN = <double *> malloc(_rotation_buckets * sizeof(double))
+if _COS == NULL or _SIN == NULL:
+    raise MemoryError()
+
+cdef int _i
+for _i in range(_rotation_buckets):
+    _COS[_i] = cos(_i * _rotation_step * M_PI / 180.0)
+    _SIN[_i] = sin(_i * _rotation_step * M_PI / 180.0)
+
+
+@cython.cdivision(True)
+cpdef tuple step(double speed, double angle, bint accel_flag, bint brake_flag,
+                 bint left_flag, bint right_flag, double max_s, double min_s,
+                 double a_rate, double d_rate, double steer_rate, double friction,
+                 double x, double y):
+    """
+    Advance car physics and position by one frame.
+
+    Returns:
+        tuple: (speed, angle, x, y, angle_idx) after the step
+    """
+    cdef double steering_factor, degrees
+    cdef int idx
+
+    # Handle acceleration and braking
+    if accel_flag:
+        speed += a_rate
+    elif brake_flag:
+        speed -= d_rate
+
+    # Apply friction
+    if speed > 0:
+        speed -= friction
+        if speed < 0:
+            speed = 0.0
+    elif speed < 0:
+        speed += friction
+        if speed > 0:
+            speed = 0.0
+
+    # Clamp speed to limits
+    if speed > max_s:
+        speed = max_s
+    elif speed < min_s:
+        speed = min_s
+
+    # Handle steering (only when moving)
+    if fabs(speed) > 0.1:
+        steering_factor = steer_rate * (speed / max_s)
+        if left_flag:
+            angle -= steering_factor
+        if right_flag:
+            angle += steering_factor
+
+    # Quantize the angle so movement matches the rendered sprite
+    degrees = fmod(angle * 180.0 / M_PI, 360.0)
+    if degrees < 0:
+        degrees += 360.0
+    idx = (<int>(degrees / _rotation_step)) % _rotation_buckets
+
+    # Update position
+    x += _COS[idx] * speed
+    y += _SIN[idx] * speed
+
+    return speed, angle, x, y, idx
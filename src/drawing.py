@@ -0,0 +1,16 @@
+"""
+Drawing Module - Shared helpers for rendering to pygame surfaces
+"""
+
+def blit_all(screen, blit_list):
+    """
+    Blit a batch of surfaces in a single call.
+    
+    Args:
+        screen: Pygame surface to draw on
+        blit_list: Sequence of (surface, position) pairs
+    """
+    if hasattr(screen, 'fblits'):
+        screen.fblits(blit_list)
+    else:
+        screen.blits(blit_list, doreturn=False)
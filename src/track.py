@@ -4,7 +4,6 @@ Track Module - Handles track generation, rendering, and collision detection
 import pygame
 import numpy as np
 import random
-import math
 
 class Track:
     """
@@ -12,6 +11,15 @@ class Track:
     Implements procedural track generation with randomized turns.
     """
     
+    __slots__ = (
+        'width', 'height', 'complexity',
+        'track_width', 'border_color', 'road_color', 'background_color',
+        'track_points', 'track_points_np', 'inner_boundary', 'outer_boundary',
+        'checkpoints', 'checkpoints_np', 'start_line',
+        '_sx1', '_sy1', '_sx2', '_sy2', '_sdx', '_sdy', '_sl2',
+        'track_surface',
+    )
+    
     def __init__(self, width=800, height=600, complexity=0.5):
         """
         Initialize the track with dimensions and properties.
@@ -29,9 +37,11 @@ class Track:
         self.track_width = 100  # Width of the track
         self.border_color = (255, 255, 255)  # White borders
         self.road_color = (50, 50, 50)  # Dark gray road
+        self.background_color = (0, 0, 0)  # Black off-track background
         
         # Track points define the center line of the track
         self.track_points = []
+        self.track_points_np = np.empty((0, 2), dtype=np.float32)
         
         # Track boundaries (inner and outer)
         self.inner_boundary = []
@@ -39,6 +49,7 @@ class Track:
         
         # Checkpoints for lap counting
         self.checkpoints = []
+        self.checkpoints_np = np.empty((0, 2), dtype=np.float32)
         
         # Start/finish line
         self.start_line = None
@@ -64,13 +75,13 @@ class Track:
         
         # Generate points around an oval
         num_points = 20
-        self.track_points = []
+        angles = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+        xs = center_x + (oval_width / 2) * np.cos(angles)
+        ys = center_y + (oval_height / 2) * np.sin(angles)
+        self.track_points_np = np.stack([xs, ys], axis=1).astype(np.float32)
         
-        for i in range(num_points):
-            angle = 2 * math.pi * i / num_points
-            x = center_x + (oval_width / 2) * math.cos(angle)
-            y = center_y + (oval_height / 2) * math.sin(angle)
-            self.track_points.append((x, y))
+        # Keep a list of tuples for pygame drawing
+        self.track_points = list(map(tuple, self.track_points_np.tolist()))
         
         # Generate inner and outer boundaries
         self._generate_boundaries()
@@ -80,52 +91,49 @@ class Track:
         
         # Set start/finish line
         self.start_line = (self.track_points[0], self.track_points[-1])
+        
+        # Precompute start line endpoints and segment terms for lap checks
+        (self._sx1, self._sy1), (self._sx2, self._sy2) = self.start_line
+        self._sdx = self._sx2 - self._sx1
+        self._sdy = self._sy2 - self._sy1
+        self._sl2 = self._sdx * self._sdx + self._sdy * self._sdy
     
     def _generate_boundaries(self):
         """Generate inner and outer track boundaries based on track points."""
-        self.inner_boundary = []
-        self.outer_boundary = []
+        points = self.track_points_np.astype(np.float64)
         
-        for i in range(len(self.track_points)):
-            # Get current point and next point
-            current = self.track_points[i]
-            next_idx = (i + 1) % len(self.track_points)
-            next_point = self.track_points[next_idx]
-            
-            # Calculate direction vector
-            dx = next_point[0] - current[0]
-            dy = next_point[1] - current[1]
-            
-            # Normalize direction vector
-            length = math.sqrt(dx*dx + dy*dy)
-            if length > 0:
-                dx /= length
-                dy /= length
-            
-            # Calculate perpendicular vector
-            perpendicular_x = -dy
-            perpendicular_y = dx
-            
-            # Calculate inner and outer points
-            half_width = self.track_width / 2
-            inner_x = current[0] - perpendicular_x * half_width
-            inner_y = current[1] - perpendicular_y * half_width
-            outer_x = current[0] + perpendicular_x * half_width
-            outer_y = current[1] + perpendicular_y * half_width
-            
-            # Add to boundaries
-            self.inner_boundary.append((inner_x, inner_y))
-            self.outer_boundary.append((outer_x, outer_y))
+        # Calculate direction vectors from each point to the next
+        direction = np.roll(points, -1, axis=0) - points
+        
+        # Normalize direction vectors (zero-length segments stay zero)
+        lengths = np.linalg.norm(direction, axis=1, keepdims=True)
+        direction = np.divide(direction, lengths, out=np.zeros_like(direction), where=lengths > 0)
+        
+        # Calculate perpendicular vectors
+        perpendicular = np.stack([-direction[:, 1], direction[:, 0]], axis=1)
+        
+        # Calculate inner and outer points
+        half_width = self.track_width / 2
+        inner = points - perpendicular * half_width
+        outer = points + perpendicular * half_width
+        
+        # Convert back to lists of tuples for pygame drawing
+        self.inner_boundary = [tuple(p) for p in inner.tolist()]
+        self.outer_boundary = [tuple(p) for p in outer.tolist()]
     
     def _generate_checkpoints(self):
         """Generate checkpoints for lap counting."""
         # Use track points as checkpoints
         self.checkpoints = self.track_points.copy()
+        
+        # Cache checkpoints as an array for nearest-checkpoint lookups
+        self.checkpoints_np = self.track_points_np.copy()
     
     def _create_track_surface(self):
         """Create a surface with the track drawn on it."""
-        # Create a surface for the track
-        track_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Create an opaque surface for the track covering the whole screen
+        track_surface = pygame.Surface((self.width, self.height))
+        track_surface.fill(self.background_color)
         
         # Draw the road
         if len(self.outer_boundary) > 2:
@@ -140,7 +148,8 @@ class Track:
         if self.start_line:
             pygame.draw.line(track_surface, (255, 0, 0), self.start_line[0], self.start_line[1], 3)
         
-        return track_surface
+        # Match the display pixel format for fast blitting
+        return track_surface.convert()
     
     def render(self, screen):
         """
@@ -175,20 +184,9 @@ class Track:
         Returns:
             int: Index of the nearest checkpoint
         """
-        # Find the nearest checkpoint
-        min_distance = float('inf')
-        nearest_idx = 0
-        
-        for i, checkpoint in enumerate(self.checkpoints):
-            dx = position[0] - checkpoint[0]
-            dy = position[1] - checkpoint[1]
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest_idx = i
-        
-        return nearest_idx
+        # Find the nearest checkpoint (squared distance is enough for argmin)
+        diff = self.checkpoints_np - np.asarray(position, dtype=np.float32)
+        return int(np.argmin((diff * diff).sum(axis=1)))
     
     def is_on_start_line(self, position, threshold=20):
         """
@@ -204,26 +202,24 @@ class Track:
         if not self.start_line:
             return False
         
-        # Calculate distance to line segment
+        # Calculate distance to line segment using the precomputed endpoints
         x, y = position
-        x1, y1 = self.start_line[0]
-        x2, y2 = self.start_line[1]
+        x1 = self._sx1
+        y1 = self._sy1
         
-        # Line segment length squared
-        l2 = (x2 - x1)**2 + (y2 - y1)**2
+        # Compare squared distances to avoid a square root
+        threshold_sq = threshold * threshold
         
         # If line segment is a point, calculate distance to that point
-        if l2 == 0:
-            return math.sqrt((x - x1)**2 + (y - y1)**2) <= threshold
+        if self._sl2 == 0:
+            return (x - x1)**2 + (y - y1)**2 <= threshold_sq
         
         # Calculate projection of point onto line segment
-        t = max(0, min(1, ((x - x1) * (x2 - x1) + (y - y1) * (y2 - y1)) / l2))
+        t = max(0, min(1, ((x - x1) * self._sdx + (y - y1) * self._sdy) / self._sl2))
         
         # Calculate closest point on line segment
-        px = x1 + t * (x2 - x1)
-        py = y1 + t * (y2 - y1)
-        
-        # Calculate distance to closest point
-        distance = math.sqrt((x - px)**2 + (y - py)**2)
+        px = x1 + t * self._sdx
+        py = y1 + t * self._sdy
         
-        return distance <= threshold
+        # Calculate squared distance to closest point
+        return (x - px)**2 + (y - py)**2 <= threshold_sq
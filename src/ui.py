@@ -3,6 +3,12 @@ UI Module - Handles game user interface elements and rendering
 """
 import pygame
 import math
+from collections import OrderedDict
+from drawing import blit_all
+
+# Maximum number of rendered text surfaces kept in the UI cache
+TEXT_CACHE_SIZE = 64
+
 
 class UI:
     """
@@ -10,6 +16,16 @@ class UI:
     Displays lap count, time remaining, and best lap time.
     """
     
+    __slots__ = (
+        'screen_width', 'screen_height',
+        'text_color', 'background_color', 'highlight_color',
+        'font_large', 'font_medium', 'font_small',
+        'top_margin', 'side_margin',
+        '_text_cache', '_last_time_key', '_last_time_surf',
+        '_last_best_lap_time', '_last_best_lap_surf', '_last_labels',
+        'top_bar', 'game_over_surface',
+    )
+    
     def __init__(self, screen):
         """
         Initialize the UI with screen dimensions.
@@ -35,19 +51,71 @@ class UI:
         self.top_margin = 20
         self.side_margin = 20
         
+        # Rendered text surfaces keyed by (text, font, color), least recently used first
+        self._text_cache = OrderedDict()
+        
+        # Last rendered time and best lap labels, reused until their values change
+        self._last_time_key = None
+        self._last_time_surf = None
+        self._last_best_lap_time = None
+        self._last_best_lap_surf = None
+        
+        # Last drawn (surface, rect) for each top bar label, used for dirty rects
+        self._last_labels = {}
+        
         # Create UI surfaces
         self._create_ui_surfaces()
     
     def _create_ui_surfaces(self):
         """Create UI surface elements."""
         # Top bar background
-        self.top_bar = pygame.Surface((self.screen_width, 60), pygame.SRCALPHA)
+        self.top_bar = pygame.Surface((self.screen_width, 60), pygame.SRCALPHA).convert_alpha()
         self.top_bar.fill(self.background_color)
         
         # Game over screen
-        self.game_over_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        self.game_over_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA).convert_alpha()
         self.game_over_surface.fill((0, 0, 0, 200))  # Dark semi-transparent background
     
+    def _render_text(self, text, font, color):
+        """
+        Render text, reusing a cached surface if the same text was rendered before.
+        
+        Args:
+            text: String to render
+            font: Pygame font to render with
+            color: Text color
+            
+        Returns:
+            pygame.Surface: Rendered text surface
+        """
+        key = (text, id(font), color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+    
+    def _format_best_lap(self, best_lap_time):
+        """
+        Format the best lap time as MM:SS.hh.
+        
+        Args:
+            best_lap_time: Best lap time in seconds
+            
+        Returns:
+            str: Best lap label text
+        """
+        if best_lap_time == float('inf'):
+            return "Best Lap: --:--"
+        best_minutes = int(best_lap_time) // 60
+        best_seconds = int(best_lap_time) % 60
+        best_ms = int((best_lap_time - int(best_lap_time)) * 100)
+        return f"Best Lap: {best_minutes:02d}:{best_seconds:02d}.{best_ms:02d}"
+    
     def render(self, screen, lap_count, remaining_time, best_lap_time):
         """
         Render UI elements to the screen.
@@ -57,38 +125,56 @@ class UI:
             lap_count: Current lap count
             remaining_time: Time remaining in seconds
             best_lap_time: Best lap time in seconds
+            
+        Returns:
+            list: Rects of label regions that changed since the last frame
         """
-        # Draw top bar
-        screen.blit(self.top_bar, (0, 0))
-        
-        # Format time remaining as MM:SS
-        minutes = int(remaining_time) // 60
-        seconds = int(remaining_time) % 60
-        time_str = f"Time: {minutes:02d}:{seconds:02d}"
-        
-        # Format best lap time
-        if best_lap_time == float('inf'):
-            best_lap_str = "Best Lap: --:--"
-        else:
-            best_minutes = int(best_lap_time) // 60
-            best_seconds = int(best_lap_time) % 60
-            best_ms = int((best_lap_time - int(best_lap_time)) * 100)
-            best_lap_str = f"Best Lap: {best_minutes:02d}:{best_seconds:02d}.{best_ms:02d}"
+        # Only format and render the time when the displayed second or flash state changes
+        flash = remaining_time < 10 and int(remaining_time * 2) % 2 == 0
+        time_key = (int(remaining_time), flash)
+        if time_key != self._last_time_key:
+            # Format time remaining as MM:SS
+            minutes = int(remaining_time) // 60
+            seconds = int(remaining_time) % 60
+            time_str = f"Time: {minutes:02d}:{seconds:02d}"
+            
+            # If time is running out, flash the time
+            time_color = self.highlight_color if flash else self.text_color
+            self._last_time_surf = self._render_text(time_str, self.font_medium, time_color)
+            self._last_time_key = time_key
+        
+        # Only format and render the best lap when it changes
+        if best_lap_time != self._last_best_lap_time:
+            self._last_best_lap_surf = self._render_text(
+                self._format_best_lap(best_lap_time), self.font_medium, self.text_color)
+            self._last_best_lap_time = best_lap_time
         
         # Render text
-        lap_text = self.font_medium.render(f"Lap: {lap_count}", True, self.text_color)
-        time_text = self.font_medium.render(time_str, True, self.text_color)
-        best_lap_text = self.font_medium.render(best_lap_str, True, self.text_color)
+        lap_text = self._render_text(f"Lap: {lap_count}", self.font_medium, self.text_color)
+        time_text = self._last_time_surf
+        best_lap_text = self._last_best_lap_surf
         
         # Position text
-        screen.blit(lap_text, (self.side_margin, self.top_margin))
-        screen.blit(time_text, (self.screen_width // 2 - time_text.get_width() // 2, self.top_margin))
-        screen.blit(best_lap_text, (self.screen_width - best_lap_text.get_width() - self.side_margin, self.top_margin))
-        
-        # If time is running out, flash the time
-        if remaining_time < 10 and int(remaining_time * 2) % 2 == 0:
-            time_text = self.font_medium.render(time_str, True, self.highlight_color)
-            screen.blit(time_text, (self.screen_width // 2 - time_text.get_width() // 2, self.top_margin))
+        labels = {
+            'lap': (lap_text, (self.side_margin, self.top_margin)),
+            'time': (time_text, (self.screen_width // 2 - time_text.get_width() // 2, self.top_margin)),
+            'best_lap': (best_lap_text, (self.screen_width - best_lap_text.get_width() - self.side_margin, self.top_margin)),
+        }
+        
+        # Draw top bar and text
+        blit_all(screen, [(self.top_bar, (0, 0))] + list(labels.values()))
+        
+        # Collect label regions whose surface changed, covering the old text too
+        dirty = []
+        for name, (surface, pos) in labels.items():
+            last = self._last_labels.get(name)
+            if last is not None and last[0] is surface:
+                continue
+            rect = surface.get_rect(topleft=pos)
+            dirty.append(rect if last is None else rect.union(last[1]))
+            self._last_labels[name] = (surface, rect)
+        
+        return dirty
     
     def render_game_over(self, screen, lap_count, best_lap_time):
         """
@@ -99,34 +185,26 @@ class UI:
             lap_count: Final lap count
             best_lap_time: Best lap time in seconds
         """
-        # Draw game over background
-        screen.blit(self.game_over_surface, (0, 0))
-        
         # Render game over text
-        game_over_text = self.font_large.render("GAME OVER", True, self.highlight_color)
-        
-        # Format best lap time
-        if best_lap_time == float('inf'):
-            best_lap_str = "Best Lap: --:--"
-        else:
-            best_minutes = int(best_lap_time) // 60
-            best_seconds = int(best_lap_time) % 60
-            best_ms = int((best_lap_time - int(best_lap_time)) * 100)
-            best_lap_str = f"Best Lap: {best_minutes:02d}:{best_seconds:02d}.{best_ms:02d}"
+        game_over_text = self._render_text("GAME OVER", self.font_large, self.highlight_color)
         
         # Render stats text
-        laps_text = self.font_medium.render(f"Laps Completed: {lap_count}", True, self.text_color)
-        best_lap_text = self.font_medium.render(best_lap_str, True, self.text_color)
-        restart_text = self.font_medium.render("Press SPACE to restart", True, self.text_color)
+        laps_text = self._render_text(f"Laps Completed: {lap_count}", self.font_medium, self.text_color)
+        best_lap_text = self._render_text(self._format_best_lap(best_lap_time), self.font_medium, self.text_color)
+        restart_text = self._render_text("Press SPACE to restart", self.font_medium, self.text_color)
         
         # Position text
         center_x = self.screen_width // 2
         center_y = self.screen_height // 2
         
-        screen.blit(game_over_text, (center_x - game_over_text.get_width() // 2, center_y - 100))
-        screen.blit(laps_text, (center_x - laps_text.get_width() // 2, center_y - 20))
-        screen.blit(best_lap_text, (center_x - best_lap_text.get_width() // 2, center_y + 20))
-        screen.blit(restart_text, (center_x - restart_text.get_width() // 2, center_y + 100))
+        # Draw game over background and text
+        blit_all(screen, [
+            (self.game_over_surface, (0, 0)),
+            (game_over_text, (center_x - game_over_text.get_width() // 2, center_y - 100)),
+            (laps_text, (center_x - laps_text.get_width() // 2, center_y - 20)),
+            (best_lap_text, (center_x - best_lap_text.get_width() // 2, center_y + 20)),
+            (restart_text, (center_x - restart_text.get_width() // 2, center_y + 100)),
+        ])
     
     def render_start_screen(self, screen):
         """
@@ -139,12 +217,12 @@ class UI:
         screen.fill((0, 0, 0))  # Black background
         
         # Render title text
-        title_text = self.font_large.render("RETRO RACING GAME", True, self.highlight_color)
+        title_text = self._render_text("RETRO RACING GAME", self.font_large, self.highlight_color)
         
         # Render instructions
-        instructions1 = self.font_medium.render("Arrow Keys to Drive", True, self.text_color)
-        instructions2 = self.font_medium.render("Complete as many laps as possible before time runs out!", True, self.text_color)
-        start_text = self.font_medium.render("Press SPACE to start", True, self.text_color)
+        instructions1 = self._render_text("Arrow Keys to Drive", self.font_medium, self.text_color)
+        instructions2 = self._render_text("Complete as many laps as possible before time runs out!", self.font_medium, self.text_color)
+        start_text = self._render_text("Press SPACE to start", self.font_medium, self.text_color)
         
         # Position text
         center_x = self.screen_width // 2